@@ -4,16 +4,22 @@
  * A comprehensive, fair comparison between SonicSV and libcsv parsers.
  * Generates test data, runs identical workloads, and produces detailed reports.
  *
- * Build: gcc -O3 -march=native -o benchmark_suite benchmark_suite.c -lcsv -lpthread -lm
- * Usage: ./benchmark_suite [--iterations N] [--warmup N] [--output FILE]
+ * Build: gcc -std=c11 -O3 -march=native -DSONICSV_IMPLEMENTATION \
+ *        -o benchmark_suite benchmark_suite.c -lcsv -lpthread -lm
+ * Usage: ./benchmark_suite [--iterations N] [--warmup N] [--output FILE] [--cpu N]
+ *                          [--cold-cache] [--temp-dir DIR]
  */
 
 #define _POSIX_C_SOURCE 200809L
+#ifdef __linux__
+#define _GNU_SOURCE  /* sched_setaffinity / cpu_set_t */
+#endif
 
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
 #include <stdint.h>
+#include <limits.h>
 #include <stdbool.h>
 #include <time.h>
 #include <math.h>
@@ -23,6 +29,11 @@
 #include <unistd.h>
 #include <sys/mman.h>
 #include <fcntl.h>
+#ifdef __linux__
+#include <sched.h>
+#include <sys/vfs.h>
+#include <linux/magic.h>
+#endif
 
 /* Include libcsv first to avoid conflicts */
 #include <csv.h>
@@ -40,7 +51,8 @@
 #define DEFAULT_WARMUP        2
 #define MAX_FIELD_SIZE        1024
 #define MAX_FIELDS_PER_ROW    100
-#define TEMP_DIR              "/tmp/sonicsv_bench"
+#define WRITE_BUFFER_SIZE     (1 << 20)
+#define DEFAULT_TEMP_DIR      "/tmp/sonicsv_bench"
 
 /*
  * Test configurations
@@ -88,12 +100,16 @@ static const test_config_t test_configs[] = {
 
 /*
  * Timing utilities
+ *
+ * Running statistics use Welford's update: still one pass, but the variance
+ * doesn't come from subtracting two nearly equal sums, which loses most of
+ * its digits when the per-run spread is tiny next to the mean.
  */
 typedef struct {
     double min;
     double max;
-    double sum;
-    double sum_sq;
+    double mean;
+    double m2;      /* Sum of squared deviations from the running mean */
     size_t count;
 } timing_stats_t;
 
@@ -106,27 +122,28 @@ static inline uint64_t get_time_ns(void) {
 static void stats_init(timing_stats_t *s) {
     s->min = 1e30;
     s->max = 0;
-    s->sum = 0;
-    s->sum_sq = 0;
+    s->mean = 0;
+    s->m2 = 0;
     s->count = 0;
 }
 
 static void stats_add(timing_stats_t *s, double value) {
     if (value < s->min) s->min = value;
     if (value > s->max) s->max = value;
-    s->sum += value;
-    s->sum_sq += value * value;
     s->count++;
+    double delta = value - s->mean;
+    s->mean += delta / s->count;
+    s->m2 += delta * (value - s->mean);
 }
 
 static double stats_mean(const timing_stats_t *s) {
-    return s->count > 0 ? s->sum / s->count : 0;
+    return s->count > 0 ? s->mean : 0;
 }
 
+/* Sample standard deviation (n - 1): the runs are a sample, not the population. */
 static double stats_stddev(const timing_stats_t *s) {
     if (s->count < 2) return 0;
-    double mean = stats_mean(s);
-    double variance = (s->sum_sq / s->count) - (mean * mean);
+    double variance = s->m2 / (s->count - 1);
     return variance > 0 ? sqrt(variance) : 0;
 }
 
@@ -135,33 +152,97 @@ static double stats_stddev(const timing_stats_t *s) {
  */
 static uint32_t g_rng_state = 12345;
 
+static inline uint32_t rng_step(uint32_t *state) {
+    *state = *state * 1103515245 + 12345;
+    return (*state >> 16) & 0x7FFF;
+}
+
 static uint32_t rng_next(void) {
-    g_rng_state = g_rng_state * 1103515245 + 12345;
-    return (g_rng_state >> 16) & 0x7FFF;
+    return rng_step(&g_rng_state);
+}
+
+/* Map a 15-bit draw onto [0, n) with a multiply and shift instead of a
+ * modulo. The bias is negligible for the small n used here. */
+static inline uint32_t rng_scale(uint32_t r, uint32_t n) {
+    return (r * n) >> 15;
 }
 
 static void rng_seed(uint32_t seed) {
     g_rng_state = seed;
 }
 
-static void generate_field(char *buf, size_t max_len, size_t target_len,
-                           bool allow_comma, bool allow_newline) {
-    static const char charset[] = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 ";
+static const char gen_charset[] =
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 ";
+
+static inline void fill_field(char *buf, size_t len, uint32_t *state,
+                              bool allow_comma, bool allow_newline) {
+    if (!allow_comma && !allow_newline) {
+        /* Nothing to sprinkle in: skip the per-character roll entirely so
+         * plain fields cost one RNG draw per byte instead of two. */
+        for (size_t i = 0; i < len; i++) {
+            buf[i] = gen_charset[rng_scale(rng_step(state), sizeof(gen_charset) - 1)];
+        }
+    } else {
+        for (size_t i = 0; i < len; i++) {
+            uint32_t r = rng_scale(rng_step(state), 100);
+            if (allow_comma && r < 3) {
+                buf[i] = ',';
+            } else if (allow_newline && r < 5) {
+                buf[i] = '\n';
+            } else {
+                buf[i] = gen_charset[rng_scale(rng_step(state), sizeof(gen_charset) - 1)];
+            }
+        }
+    }
+}
+
+/* One specialization per special-character mix, so the allow_* tests are
+ * folded at compile time instead of being re-checked for every byte. */
+typedef void (*field_fill_fn)(char *buf, size_t len, uint32_t *state);
+
+static void fill_plain(char *buf, size_t len, uint32_t *state)    { fill_field(buf, len, state, false, false); }
+static void fill_newlines(char *buf, size_t len, uint32_t *state) { fill_field(buf, len, state, false, true); }
+static void fill_commas(char *buf, size_t len, uint32_t *state)   { fill_field(buf, len, state, true, false); }
+static void fill_mixed(char *buf, size_t len, uint32_t *state)    { fill_field(buf, len, state, true, true); }
+
+static field_fill_fn select_field_filler(bool allow_comma, bool allow_newline) {
+    static const field_fill_fn fillers[4] = {
+        fill_plain, fill_newlines, fill_commas, fill_mixed
+    };
+    return fillers[(allow_comma ? 2 : 0) | (allow_newline ? 1 : 0)];
+}
+
+static size_t generate_field(char *buf, size_t max_len, size_t target_len,
+                             field_fill_fn fill) {
     size_t len = target_len + (rng_next() % (target_len / 2 + 1)) - target_len / 4;
     if (len < 1) len = 1;
     if (len >= max_len) len = max_len - 1;
 
-    for (size_t i = 0; i < len; i++) {
-        int r = rng_next() % 100;
-        if (allow_comma && r < 3) {
-            buf[i] = ',';
-        } else if (allow_newline && r < 5) {
-            buf[i] = '\n';
-        } else {
-            buf[i] = charset[rng_next() % (sizeof(charset) - 1)];
-        }
-    }
+    /* Work on a local copy of the RNG state: buf is a char pointer and may
+     * alias the global, which would force a reload/store around every byte. */
+    uint32_t state = g_rng_state;
+    fill(buf, len, &state);
     buf[len] = '\0';
+    g_rng_state = state;
+    return len;
+}
+
+/*
+ * Output is assembled in a chunk buffer and handed to fwrite() once it fills
+ * up, instead of one stdio call per byte or field. Plain fields are generated
+ * straight into the buffer. Flushing whenever less than GEN_FIELD_WORST_CASE
+ * bytes remain guarantees the next field always fits: delimiter, both quotes,
+ * every byte escaped, the row's newline and generate_field()'s terminator.
+ */
+#define GEN_FIELD_WORST_CASE (2 * MAX_FIELD_SIZE + 4)
+
+static bool flush_chunk(FILE *f, const char *buf, size_t *pos, size_t *total) {
+    if (*pos > 0 && fwrite(buf, 1, *pos, f) != *pos) {
+        return false;
+    }
+    *total += *pos;
+    *pos = 0;
+    return true;
 }
 
 static size_t generate_test_file(const test_config_t *config, const char *filepath) {
@@ -173,63 +254,162 @@ static size_t generate_test_file(const test_config_t *config, const char *filepa
 
     rng_seed(42);  /* Deterministic for reproducibility */
 
+    static char out[WRITE_BUFFER_SIZE];
+    const size_t flush_at = sizeof(out) - GEN_FIELD_WORST_CASE;
+    size_t pos = 0;
     char field_buf[MAX_FIELD_SIZE];
     size_t total_bytes = 0;
 
+    /* Quoting can only be triggered by characters generate_field() was
+     * allowed to emit; without commas or newlines every field is written
+     * verbatim and the per-field scans are skipped. */
+    const bool may_need_quotes = config->has_quotes &&
+                                 (config->has_commas_in_fields ||
+                                  config->has_newlines_in_fields);
+    const field_fill_fn fill = select_field_filler(config->has_commas_in_fields,
+                                                   config->has_newlines_in_fields);
+
     /* Generate header row */
     for (size_t col = 0; col < config->fields_per_row; col++) {
-        if (col > 0) {
-            fputc(',', f);
-            total_bytes++;
-        }
-        int written = fprintf(f, "col%zu", col);
-        total_bytes += written;
+        if (pos > flush_at && !flush_chunk(f, out, &pos, &total_bytes)) goto write_error;
+        if (col > 0) out[pos++] = ',';
+        pos += (size_t)snprintf(out + pos, sizeof(out) - pos, "col%zu", col);
     }
-    fputc('\n', f);
-    total_bytes++;
+    out[pos++] = '\n';
 
     /* Generate data rows */
     for (size_t row = 0; row < config->rows; row++) {
         for (size_t col = 0; col < config->fields_per_row; col++) {
-            if (col > 0) {
-                fputc(',', f);
-                total_bytes++;
+            if (pos > flush_at && !flush_chunk(f, out, &pos, &total_bytes)) goto write_error;
+            if (col > 0) out[pos++] = ',';
+
+            if (!may_need_quotes) {
+                pos += generate_field(out + pos, MAX_FIELD_SIZE, config->avg_field_size, fill);
+                continue;
             }
 
-            generate_field(field_buf, MAX_FIELD_SIZE, config->avg_field_size,
-                          config->has_commas_in_fields, config->has_newlines_in_fields);
-
-            bool needs_quotes = config->has_quotes &&
-                               (strchr(field_buf, ',') || strchr(field_buf, '\n') ||
-                                strchr(field_buf, '"'));
-
-            if (needs_quotes) {
-                fputc('"', f);
-                total_bytes++;
-                for (char *p = field_buf; *p; p++) {
-                    if (*p == '"') {
-                        fputc('"', f);
-                        fputc('"', f);
-                        total_bytes += 2;
-                    } else {
-                        fputc(*p, f);
-                        total_bytes++;
+            size_t len = generate_field(field_buf, MAX_FIELD_SIZE, config->avg_field_size, fill);
+
+            if (strpbrk(field_buf, ",\n\"") != NULL) {
+                out[pos++] = '"';
+                if (!memchr(field_buf, '"', len)) {
+                    /* gen_charset has no '"', so this is the usual case:
+                     * nothing to escape, copy the body in one go. */
+                    memcpy(out + pos, field_buf, len);
+                    pos += len;
+                } else {
+                    for (char *p = field_buf; *p; p++) {
+                        if (*p == '"') out[pos++] = '"';
+                        out[pos++] = *p;
                     }
                 }
-                fputc('"', f);
-                total_bytes++;
+                out[pos++] = '"';
             } else {
-                size_t len = strlen(field_buf);
-                fwrite(field_buf, 1, len, f);
-                total_bytes += len;
+                memcpy(out + pos, field_buf, len);
+                pos += len;
             }
         }
-        fputc('\n', f);
-        total_bytes++;
+        out[pos++] = '\n';
     }
 
-    fclose(f);
+    if (!flush_chunk(f, out, &pos, &total_bytes)) goto write_error;
+    if (fclose(f) != 0) {
+        fprintf(stderr, "Error: Cannot write file %s: %s\n", filepath, strerror(errno));
+        unlink(filepath);
+        return 0;
+    }
     return total_bytes;
+
+write_error:
+    fprintf(stderr, "Error: Cannot write file %s: %s\n", filepath, strerror(errno));
+    fclose(f);
+    /* Don't leave a truncated file behind: the caller skips the test and
+     * never reaches its unlink(), and the temp dir's rmdir() would then fail. */
+    unlink(filepath);
+    return 0;
+}
+
+/*
+ * CPU pinning - keeps both parsers on the same core for the whole run so
+ * scheduler migrations and mixed P/E cores don't show up as variance.
+ */
+static int pin_to_cpu(int cpu) {
+#ifdef __linux__
+    if (cpu >= CPU_SETSIZE) {
+        fprintf(stderr, "Error: CPU %d is out of range (max %d)\n", cpu, CPU_SETSIZE - 1);
+        return -1;
+    }
+    cpu_set_t set;
+    CPU_ZERO(&set);
+    CPU_SET(cpu, &set);
+    if (sched_setaffinity(0, sizeof(set), &set) != 0) {
+        fprintf(stderr, "Error: Cannot pin to CPU %d: %s\n", cpu, strerror(errno));
+        return -1;
+    }
+    return 0;
+#else
+    fprintf(stderr, "Warning: --cpu is only supported on Linux, ignoring\n");
+    (void)cpu;
+    return 0;
+#endif
+}
+
+/*
+ * Page cache control - by default every timed run after the first reads the
+ * file from the page cache, which measures memory bandwidth as much as the
+ * parser. With --cold-cache the file's pages are evicted before each timed
+ * run. Dirty pages can't be dropped, so flush the freshly generated file first.
+ */
+#if defined(POSIX_FADV_DONTNEED)
+#define HAVE_DROP_FILE_CACHE 1
+#endif
+
+#ifdef HAVE_DROP_FILE_CACHE
+/* A failed eviction means the "cold cache" runs are really warm; say so once
+ * rather than flooding stderr on every iteration. */
+static void warn_drop_failed(const char *what, const char *filepath, int err) {
+    static bool warned = false;
+    if (warned) return;
+    warned = true;
+    fprintf(stderr, "Warning: --cold-cache: %s failed for %s: %s; "
+            "affected runs were measured with a warm cache\n",
+            what, filepath, strerror(err));
+}
+#endif
+
+static void drop_file_cache(const char *filepath) {
+#ifdef HAVE_DROP_FILE_CACHE
+    int fd = open(filepath, O_RDONLY);
+    if (fd < 0) {
+        warn_drop_failed("open", filepath, errno);
+        return;
+    }
+    if (fdatasync(fd) != 0) {
+        warn_drop_failed("fdatasync", filepath, errno);
+    }
+    /* posix_fadvise returns the error number instead of setting errno. */
+    int rc = posix_fadvise(fd, 0, 0, POSIX_FADV_DONTNEED);
+    if (rc != 0) {
+        warn_drop_failed("posix_fadvise", filepath, rc);
+    }
+    close(fd);
+#else
+    (void)filepath;
+#endif
+}
+
+/* On tmpfs/ramfs the page cache *is* the file: fdatasync and
+ * POSIX_FADV_DONTNEED both succeed there but evict nothing. */
+static bool dir_is_memory_backed(const char *dir) {
+#ifdef __linux__
+    struct statfs st;
+    if (statfs(dir, &st) != 0) return false;
+    return (unsigned long)st.f_type == TMPFS_MAGIC ||
+           (unsigned long)st.f_type == RAMFS_MAGIC;
+#else
+    (void)dir;
+    return false;
+#endif
 }
 
 /*
@@ -387,10 +567,27 @@ static void print_line(FILE *out, int width) {
     fputc('\n', out);
 }
 
+/* Tests skipped by the runner (failed generation, or a parser with no
+ * successful runs) keep zero means and speedup; they must not feed the
+ * aggregates below, which would otherwise come out as inf/nan. */
+static bool result_is_valid(const test_result_t *r) {
+    return r->sonicsv_times.count > 0 && r->libcsv_times.count > 0;
+}
+
 static void print_report(FILE *out, test_result_t *results, size_t num_results,
                          int iterations, int warmup) {
     const int width = 95;
 
+    size_t num_valid = 0;
+    for (size_t i = 0; i < num_results; i++) {
+        if (result_is_valid(&results[i])) num_valid++;
+    }
+
+    if (num_valid == 0) {
+        fprintf(out, "\nNo benchmark results to report.\n");
+        return;
+    }
+
     fprintf(out, "\n");
     print_separator(out, width);
     fprintf(out, "SONICSV vs LIBCSV BENCHMARK REPORT\n");
@@ -405,7 +602,7 @@ static void print_report(FILE *out, test_result_t *results, size_t num_results,
     print_line(out, width);
     fprintf(out, "  Timestamp:           %s\n", time_str);
     fprintf(out, "  Iterations:          %d (after %d warmup runs)\n", iterations, warmup);
-    fprintf(out, "  Test cases:          %zu\n", num_results);
+    fprintf(out, "  Test cases:          %zu (%zu failed)\n", num_valid, num_results - num_valid);
 
 #ifdef __APPLE__
     fprintf(out, "  Platform:            macOS\n");
@@ -428,6 +625,7 @@ static void print_report(FILE *out, test_result_t *results, size_t num_results,
     int sonicsv_wins = 0, libcsv_wins = 0, ties = 0;
 
     for (size_t i = 0; i < num_results; i++) {
+        if (!result_is_valid(&results[i])) continue;
         total_sonicsv_time += stats_mean(&results[i].sonicsv_times);
         total_libcsv_time += stats_mean(&results[i].libcsv_times);
         total_bytes += results[i].file_size;
@@ -444,9 +642,9 @@ static void print_report(FILE *out, test_result_t *results, size_t num_results,
 
     fprintf(out, "\nOVERALL SUMMARY\n");
     print_line(out, width);
-    fprintf(out, "  SonicSV victories:   %d / %zu tests (>5%% faster)\n", sonicsv_wins, num_results);
-    fprintf(out, "  libcsv victories:    %d / %zu tests (>5%% faster)\n", libcsv_wins, num_results);
-    fprintf(out, "  Ties:                %d / %zu tests (within 5%%)\n", ties, num_results);
+    fprintf(out, "  SonicSV victories:   %d / %zu tests (>5%% faster)\n", sonicsv_wins, num_valid);
+    fprintf(out, "  libcsv victories:    %d / %zu tests (>5%% faster)\n", libcsv_wins, num_valid);
+    fprintf(out, "  Ties:                %d / %zu tests (within 5%%)\n", ties, num_valid);
     fprintf(out, "\n");
     fprintf(out, "  Aggregate SonicSV:   %.1f MB/s (total: %.2f MB in %.3f s)\n",
             avg_sonicsv_throughput, total_bytes / (1024.0 * 1024.0), total_sonicsv_time);
@@ -455,7 +653,7 @@ static void print_report(FILE *out, test_result_t *results, size_t num_results,
     fprintf(out, "  Aggregate speedup:   %.2fx\n", avg_sonicsv_throughput / avg_libcsv_throughput);
     fprintf(out, "\n");
     fprintf(out, "  Per-test speedup:\n");
-    fprintf(out, "    Average:           %.2fx\n", sum_speedup / num_results);
+    fprintf(out, "    Average:           %.2fx\n", sum_speedup / num_valid);
     fprintf(out, "    Minimum:           %.2fx\n", min_speedup);
     fprintf(out, "    Maximum:           %.2fx\n", max_speedup);
 
@@ -471,6 +669,7 @@ static void print_report(FILE *out, test_result_t *results, size_t num_results,
 
     for (size_t i = 0; i < num_results; i++) {
         test_result_t *r = &results[i];
+        if (!result_is_valid(r)) continue;
         double size_mb = r->file_size / (1024.0 * 1024.0);
         const char *winner = r->speedup > 1.05 ? "SonicSV" :
                             (r->speedup < 0.95 ? "libcsv" : "-");
@@ -496,6 +695,7 @@ static void print_report(FILE *out, test_result_t *results, size_t num_results,
 
     for (size_t i = 0; i < num_results; i++) {
         test_result_t *r = &results[i];
+        if (!result_is_valid(r)) continue;
         fprintf(out, "%-18s %10.4f %10.4f %10.4f %10.4f\n",
                 r->test_name,
                 stats_mean(&r->sonicsv_times),
@@ -511,15 +711,23 @@ static void print_report(FILE *out, test_result_t *results, size_t num_results,
 /*
  * Main benchmark runner
  */
-static int run_benchmark_suite(int iterations, int warmup, FILE *report_out) {
+static int run_benchmark_suite(int iterations, int warmup, bool cold_cache,
+                               const char *temp_dir, FILE *report_out) {
     test_result_t results[NUM_TESTS];
     memset(results, 0, sizeof(results));
 
-    /* Create temp directory */
-    mkdir(TEMP_DIR, 0755);
+    /* Create temp directory; only remove it afterwards if it was ours. */
+    bool created_temp_dir = mkdir(temp_dir, 0755) == 0;
 
-    fprintf(report_out, "Configuration: %zu tests, %d iterations, %d warmup\n\n",
-            NUM_TESTS, iterations, warmup);
+    if (cold_cache && dir_is_memory_backed(temp_dir)) {
+        fprintf(stderr, "Error: --cold-cache cannot evict files on tmpfs/ramfs (%s); "
+                "use --temp-dir to pick a disk-backed directory\n", temp_dir);
+        if (created_temp_dir) rmdir(temp_dir);
+        return 1;
+    }
+
+    fprintf(report_out, "Configuration: %zu tests, %d iterations, %d warmup, %s cache\n\n",
+            NUM_TESTS, iterations, warmup, cold_cache ? "cold" : "warm");
 
     fprintf(report_out, "%-4s %-18s %8s %10s %10s %8s\n",
             "#", "Test", "Size", "SonicSV", "libcsv", "Speedup");
@@ -535,7 +743,11 @@ static int run_benchmark_suite(int iterations, int warmup, FILE *report_out) {
 
         /* Generate test file */
         char filepath[256];
-        snprintf(filepath, sizeof(filepath), "%s/%s.csv", TEMP_DIR, config->name);
+        if ((size_t)snprintf(filepath, sizeof(filepath), "%s/%s.csv",
+                             temp_dir, config->name) >= sizeof(filepath)) {
+            fprintf(stderr, "[%2zu] %-18s FAILED (temp path too long)\n", t + 1, config->name);
+            continue;
+        }
 
         size_t file_size = generate_test_file(config, filepath);
         if (file_size == 0) {
@@ -557,6 +769,7 @@ static int run_benchmark_suite(int iterations, int warmup, FILE *report_out) {
 
         /* Timed runs - SonicSV */
         for (int i = 0; i < iterations; i++) {
+            if (cold_cache) drop_file_cache(filepath);
             double elapsed = run_sonicsv_benchmark(filepath, file_size, &state);
             if (elapsed > 0) {
                 stats_add(&result->sonicsv_times, elapsed);
@@ -569,6 +782,7 @@ static int run_benchmark_suite(int iterations, int warmup, FILE *report_out) {
 
         /* Timed runs - libcsv */
         for (int i = 0; i < iterations; i++) {
+            if (cold_cache) drop_file_cache(filepath);
             double elapsed = run_libcsv_benchmark(filepath, file_size, &state);
             if (elapsed > 0) {
                 stats_add(&result->libcsv_times, elapsed);
@@ -579,6 +793,18 @@ static int run_benchmark_suite(int iterations, int warmup, FILE *report_out) {
             }
         }
 
+        /* A parser whose every timed run failed has no mean to divide by;
+         * report it instead of printing inf/nan throughput and speedup. */
+        bool sonicsv_failed = result->sonicsv_times.count == 0;
+        bool libcsv_failed = result->libcsv_times.count == 0;
+        if (sonicsv_failed || libcsv_failed) {
+            fprintf(stderr, "[%2zu] %-18s FAILED (no successful %s runs)\n", t + 1, config->name,
+                    sonicsv_failed && libcsv_failed ? "SonicSV or libcsv" :
+                    sonicsv_failed ? "SonicSV" : "libcsv");
+            unlink(filepath);
+            continue;
+        }
+
         /* Calculate throughput */
         double sonicsv_mean = stats_mean(&result->sonicsv_times);
         double libcsv_mean = stats_mean(&result->libcsv_times);
@@ -599,7 +825,7 @@ static int run_benchmark_suite(int iterations, int warmup, FILE *report_out) {
     }
 
     /* Cleanup */
-    rmdir(TEMP_DIR);
+    if (created_temp_dir) rmdir(temp_dir);
 
     (void)print_report; /* suppressed; --output now receives the same compact table */
     return 0;
@@ -612,17 +838,23 @@ int main(int argc, char **argv) {
     int iterations = DEFAULT_ITERATIONS;
     int warmup = DEFAULT_WARMUP;
     const char *output_file = NULL;
+    int cpu = -1;
+    bool cold_cache = false;
+    const char *temp_dir = DEFAULT_TEMP_DIR;
 
     static struct option long_options[] = {
         {"iterations", required_argument, 0, 'i'},
         {"warmup",     required_argument, 0, 'w'},
         {"output",     required_argument, 0, 'o'},
+        {"cpu",        required_argument, 0, 'c'},
+        {"cold-cache", no_argument,       0, 'C'},
+        {"temp-dir",   required_argument, 0, 't'},
         {"help",       no_argument,       0, 'h'},
         {0, 0, 0, 0}
     };
 
     int opt;
-    while ((opt = getopt_long(argc, argv, "i:w:o:h", long_options, NULL)) != -1) {
+    while ((opt = getopt_long(argc, argv, "i:w:o:c:Ct:h", long_options, NULL)) != -1) {
         switch (opt) {
             case 'i':
                 iterations = atoi(optarg);
@@ -635,6 +867,30 @@ int main(int argc, char **argv) {
             case 'o':
                 output_file = optarg;
                 break;
+            case 'c': {
+                /* Unlike the counts above, a CPU index can't be clamped to
+                 * something sensible: a typo must not silently pin to CPU 0. */
+                char *end;
+                errno = 0;
+                long value = strtol(optarg, &end, 10);
+                if (errno != 0 || end == optarg || *end != '\0' ||
+                    value < 0 || value > INT_MAX) {
+                    fprintf(stderr, "Error: Invalid CPU index '%s'\n", optarg);
+                    return 1;
+                }
+                cpu = (int)value;
+                break;
+            }
+            case 'C':
+#ifdef HAVE_DROP_FILE_CACHE
+                cold_cache = true;
+#else
+                fprintf(stderr, "Warning: --cold-cache is not supported on this platform, ignoring\n");
+#endif
+                break;
+            case 't':
+                temp_dir = optarg;
+                break;
             case 'h':
             default:
                 fprintf(stderr, "SonicSV Benchmark Suite\n\n");
@@ -643,6 +899,10 @@ int main(int argc, char **argv) {
                 fprintf(stderr, "  -i, --iterations N   Timed iterations per test (default: %d)\n", DEFAULT_ITERATIONS);
                 fprintf(stderr, "  -w, --warmup N       Warmup iterations per test (default: %d)\n", DEFAULT_WARMUP);
                 fprintf(stderr, "  -o, --output FILE    Write report to file (default: stdout)\n");
+                fprintf(stderr, "  -c, --cpu N          Pin the benchmark to CPU N (Linux only)\n");
+                fprintf(stderr, "  -C, --cold-cache     Evict the test file from the page cache before each timed run\n");
+                fprintf(stderr, "  -t, --temp-dir DIR   Directory for generated test files (default: %s;\n", DEFAULT_TEMP_DIR);
+                fprintf(stderr, "                       --cold-cache needs one that is not on tmpfs)\n");
                 fprintf(stderr, "  -h, --help           Show this help message\n\n");
                 fprintf(stderr, "This tool generates CSV test data, parses it with both SonicSV and\n");
                 fprintf(stderr, "libcsv under identical conditions, and produces a detailed comparison.\n");
@@ -650,6 +910,10 @@ int main(int argc, char **argv) {
         }
     }
 
+    if (cpu >= 0 && pin_to_cpu(cpu) != 0) {
+        return 1;
+    }
+
     FILE *report_out = stdout;
     if (output_file) {
         report_out = fopen(output_file, "w");
@@ -659,7 +923,7 @@ int main(int argc, char **argv) {
         }
     }
 
-    int result = run_benchmark_suite(iterations, warmup, report_out);
+    int result = run_benchmark_suite(iterations, warmup, cold_cache, temp_dir, report_out);
 
     if (output_file) {
         fclose(report_out);